@@ -63,6 +63,8 @@ class Event:
         self.__weak_listeners_mutex = threading.RLock()
         self.__listeners: typing.Dict[int, typing.Tuple[EventListener, WeakListenerType]] = dict()
         self.__trace = trace
+        # maintained by listen and listener removal so callers can cheaply skip building notifications.
+        self.has_listeners = False
 
     @property
     def listener_count(self) -> int:
@@ -81,10 +83,12 @@ class Event:
                 traceback.print_stack()
             with self.__weak_listeners_mutex:
                 self.__weak_listeners.remove(weak_listener)
+                self.has_listeners = bool(self.__weak_listeners)
 
         weak_listener = weakref.ref(listener, remove_listener)
         with self.__weak_listeners_mutex:
             self.__weak_listeners.append(weak_listener)
+            self.has_listeners = True
         if owner:
             def owner_gone(weak_owner: typing.Any) -> None:
                 del self.__listeners[id(weak_owner)]
@@ -119,6 +123,14 @@ class Event:
         listener = None
         if self.__weak_listeners:
             try:
+                if len(self.__weak_listeners) == 1:
+                    # the common case of a single listener does not need a copy of the weak listeners. if the listener
+                    # is removed concurrently, the index error is handled the same as a listener that is gone.
+                    listener = self.__weak_listeners[0]()
+                    if listener:
+                        listener.call(*args, **keywords)
+                    listener = None
+                    return
                 # copy the weak listeners; be careful to unreference listener just after use.
                 with self.__weak_listeners_mutex:
                     weak_listeners = list(self.__weak_listeners)
@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 # standard libraries
+import bisect
 import contextlib
 import copy
 import operator
+import sys
 import threading
 import types
 import typing
@@ -37,7 +39,7 @@ class ListModel(Observable.Observable, typing.Generic[T]):
 
     def __init__(self, key: typing.Optional[str] = None, items: typing.Optional[typing.Sequence[T]] = None) -> None:
         super().__init__()
-        self.__key = key
+        self.__key = sys.intern(key) if key is not None else None
         self.__items : typing.List[T] = list(items) if items else list()
 
     def close(self) -> None:
@@ -275,16 +277,21 @@ class FilteredListModel(Observable.Observable):
                  selection: typing.Optional[Selection.IndexedSelection] = None) -> None:
         super().__init__()
         self.__container = None
-        self.__master_items_key = master_items_key or items_key or "items"
-        self.__items_key = items_key or "items"
+        # keys are interned so the key comparisons on each notification usually succeed on identity.
+        self.__master_items_key = sys.intern(master_items_key or items_key or "items")
+        self.__items_key = sys.intern(items_key or "items")
         self.__master_items: typing.List[typing.Any] = list()  # a list of source items (to be filtered)
         self.__items: typing.List[typing.Any] = list()  # a list of filtered items
+        self.__items_shared = False  # whether items have been handed out and must be copied before changing
         self.__items_sorted = False
+        self.__item_keys: typing.Optional[typing.List[typing.Any]] = None  # sort keys parallel to items, if sorted
         self._update_mutex = threading.RLock()
         self.__filter = Filter(True)
+        self.__filter_matches: typing.Dict[typing.Any, bool] = dict()  # filter results for master items
         self.__sort_key: OptionalSortKeyCallable = None
         self.__sort_reverse = False
         self.__change_level = 0
+        self.__changes_event_level = 0  # nesting level of outgoing begin/end changes events
         self.reset_list_event = Event.Event()
         self.begin_changes_event = Event.Event()
         self.end_changes_event = Event.Event()
@@ -315,6 +322,8 @@ class FilteredListModel(Observable.Observable):
                 self.__update_items()
 
     class ChangeTracker:
+        __slots__ = ("list_model",)
+
         def __init__(self, list_model: FilteredListModel) -> None:
             self.list_model = list_model
 
@@ -334,6 +343,18 @@ class FilteredListModel(Observable.Observable):
     def mark_changed(self) -> None:
         with self.changes(): pass
 
+    def __begin_changes(self) -> None:
+        # nested begin/end changes collapse into the outermost pair, so a batch of changes sends a single pair.
+        if self.__changes_event_level == 0 and self.begin_changes_event.has_listeners:
+            self.begin_changes_event.fire(self.__items_key)
+        self.__changes_event_level += 1
+
+    def __end_changes(self) -> None:
+        # the container may send an end without a begin, for instance if this model was attached during its change.
+        self.__changes_event_level = max(self.__changes_event_level - 1, 0)
+        if self.__changes_event_level == 0 and self.end_changes_event.has_listeners:
+            self.end_changes_event.fire(self.__items_key)
+
     # thread safe.
     @property
     def sort_key(self) -> OptionalSortKeyCallable:
@@ -346,6 +367,7 @@ class FilteredListModel(Observable.Observable):
         with self._update_mutex:
             self.__sort_key = value
             self.__items_sorted = False
+            self.__item_keys = None
             self.reset_list_event.fire(self.__items_key)
         self.__update_items()
 
@@ -360,6 +382,7 @@ class FilteredListModel(Observable.Observable):
         with self._update_mutex:
             self.__sort_reverse = value
             self.__items_sorted = False
+            self.__item_keys = None
             self.reset_list_event.fire(self.__items_key)
         self.__update_items()
 
@@ -373,15 +396,27 @@ class FilteredListModel(Observable.Observable):
     def filter(self, value: Filter) -> None:
         """ Set the filter function. """
         self.__filter = value
+        self.__filter_matches = dict()
         self.__items_sorted = False
         self.reset_list_event.fire(self.__items_key)
         self.__update_items()
 
     @property
     def items(self) -> typing.Sequence[typing.Any]:
-        """ Return the items. """
+        """ Return the items.
+
+        The returned list is shared until this model changes; it must not be modified.
+        """
         with self._update_mutex:
-            return copy.copy(self.__items)
+            self.__items_shared = True
+            return self.__items
+
+    def __get_mutable_items(self) -> typing.List[typing.Any]:
+        # copy the items before changing them if they have been handed out by the items property.
+        if self.__items_shared:
+            self.__items = list(self.__items)
+            self.__items_shared = False
+        return self.__items
 
     def __getattr__(self, item: str) -> typing.Any:
         if item == self.__items_key:
@@ -405,15 +440,38 @@ class FilteredListModel(Observable.Observable):
                 high = mid
         return low
 
-    def __find_unsorted_index_for_item(self, item: typing.Any, master_items: typing.Sequence[typing.Any], filter: Filter) -> int:
+    def __find_sorted_index_for_key(self, item_sort_key: typing.Any, item_keys: typing.Sequence[typing.Any]) -> int:
+        if not self.sort_reverse:
+            return bisect.bisect_left(item_keys, item_sort_key)
+        low = 0
+        high = len(item_keys)
+        while low < high:
+            mid = (low + high) // 2
+            if item_keys[mid] > item_sort_key:
+                low = mid + 1
+            else:
+                high = mid
+        return low
+
+    def __find_unsorted_index_for_item(self, item: typing.Any, master_items: typing.Sequence[typing.Any]) -> int:
         index = 0
+        matches = self.__matches
         for item_ in master_items:
             if item_ == item:
                 break
-            if filter.matches(item_):
+            if matches(item_):
                 index += 1
         return index
 
+    def __matches(self, item: typing.Any) -> bool:
+        # filter results are cached until the filter changes, the item changes, or the items are rebuilt.
+        filter_matches = self.__filter_matches
+        matches = filter_matches.get(item)
+        if matches is None:
+            matches = self.__filter.matches(item)
+            filter_matches[item] = matches
+        return matches
+
     # thread safe
     def __inserted_master_item(self, before_index: int, item: typing.Any) -> None:
         """
@@ -423,20 +481,28 @@ class FilteredListModel(Observable.Observable):
         with self._update_mutex:
             if self.__change_level > 0:
                 return
-            if self.filter.matches(item):
+            if self.__matches(item):
                 self.__insert_item(item, self.sort_key)
 
     def __insert_item(self, item: typing.Any, sort_key: OptionalSortKeyCallable) -> None:
         items = self.__items
-        if sort_key is not None:
+        # item keys are only present outside of update items, where sort key is always the model sort key.
+        item_keys = self.__item_keys
+        item_sort_key = None
+        if item_keys is not None and sort_key is not None:
+            item_sort_key = sort_key(item)
+            before_index = self.__find_sorted_index_for_key(item_sort_key, item_keys)
+        elif sort_key is not None:
             sort_operator = operator.gt if self.sort_reverse else operator.lt
             before_index = self.__find_sorted_index_for_item(item, items, sort_key, sort_operator)
         else:
-            before_index = self.__find_unsorted_index_for_item(item, self._get_master_items(), self.filter)
-        self.__items.insert(before_index, item)
-        self.begin_changes_event.fire(self.__items_key)
+            before_index = self.__find_unsorted_index_for_item(item, self.__master_items)
+        self.__get_mutable_items().insert(before_index, item)
+        if item_keys is not None:
+            item_keys.insert(before_index, item_sort_key)
+        self.__begin_changes()
         self.notify_insert_item(self.__items_key, item, before_index)
-        self.end_changes_event.fire(self.__items_key)
+        self.__end_changes()
         # only update the selection here if there is no end changes event listener.
         # if there is a listener, updating the selection is done in end changes.
         self.__selection_changes.append((True, before_index))
@@ -445,11 +511,14 @@ class FilteredListModel(Observable.Observable):
                 selection.insert_index(before_index)
 
     def __remove_item(self, item: typing.Any) -> None:
-        item_index = self.__items.index(item)
-        del self.__items[item_index]
-        self.begin_changes_event.fire(self.__items_key)
+        items = self.__get_mutable_items()
+        item_index = items.index(item)
+        del items[item_index]
+        if self.__item_keys is not None:
+            del self.__item_keys[item_index]
+        self.__begin_changes()
         self.notify_remove_item(self.__items_key, item, item_index)
-        self.end_changes_event.fire(self.__items_key)
+        self.__end_changes()
         # only update the selection here if there is no end changes event listener.
         # if there is a listener, updating the selection is done in end changes.
         self.__selection_changes.append((False, item_index))
@@ -479,13 +548,23 @@ class FilteredListModel(Observable.Observable):
             if self.__change_level > 0:
                 return
             items = self.__items
-            if self.filter.matches(item):
+            matches = self.__filter.matches(item)
+            self.__filter_matches[item] = matches
+            if matches:
                 # item will be in the list
                 sort_key = self.sort_key
                 if sort_key is not None:
                     # are items sorted?
-                    sort_operator = operator.gt if self.sort_reverse else operator.lt
-                    before_index = self.__find_sorted_index_for_item(item, items, sort_key, sort_operator)
+                    item_keys = self.__item_keys
+                    if item_keys is not None:
+                        # the key of the item itself has changed; update it before searching.
+                        item_sort_key = sort_key(item)
+                        if item in items:
+                            item_keys[items.index(item)] = item_sort_key
+                        before_index = self.__find_sorted_index_for_key(item_sort_key, item_keys)
+                    else:
+                        sort_operator = operator.gt if self.sort_reverse else operator.lt
+                        before_index = self.__find_sorted_index_for_item(item, items, sort_key, sort_operator)
                     if item in items:
                         # item already in list?
                         index = items.index(item)
@@ -511,28 +590,29 @@ class FilteredListModel(Observable.Observable):
                     self.__removed_master_item(index, item)
 
     # thread safe.
-    def __build_items(self) -> typing.Sequence[typing.Any]:
+    def __build_items(self) -> typing.Tuple[typing.Sequence[typing.Any], typing.Optional[typing.Dict[typing.Any, typing.Any]]]:
         """Build the items from the master items list.
 
         This method is thread safe.
 
-        Builds the items from the master list by sorting them and then
-         filtering them.
+        Builds the items from the master list by filtering them and then
+        sorting them. Returns the items and, if sorted, the sort key of each item.
         """
         master_items = list(self._get_master_items())
         assert len(set(master_items)) == len(master_items)
-        # sort the master item list. this is optional since it may be sorted downstream.
-        if self.sort_key:
-            master_items.sort(key=self.sort_key, reverse=self.sort_reverse)
-        # construct the items list by expanding each master item to
-        # include its children
-        items: typing.List[typing.Any] = list()
-        for item in master_items:
-            # apply filter
-            if self.filter.matches(item):
-                # add item and its dependent items
-                items.append(item)
-        return items
+        # filter before sorting so that sort keys are only computed for items that will be in the list.
+        filter = self.filter
+        filter_matches = {item: filter.matches(item) for item in master_items}
+        self.__filter_matches = filter_matches
+        items = [item for item in master_items if filter_matches[item]]
+        # sort the item list. this is optional since it may be sorted downstream.
+        # compute each sort key once; the keys are reused when inserting the items.
+        sort_key = self.sort_key
+        if sort_key:
+            item_keys = {item: sort_key(item) for item in items}
+            items.sort(key=item_keys.__getitem__, reverse=self.sort_reverse)
+            return items, item_keys
+        return items, None
 
     # thread safe.
     def __update_items(self) -> None:
@@ -545,8 +625,10 @@ class FilteredListModel(Observable.Observable):
             if self.__change_level > 0:
                 return
             # first build the new items list, including items with master item.
-            old_items = copy.copy(self.__items)
-            items = self.__build_items()
+            # the current items are handed to the updates below as shared, so they are copied only if changed.
+            old_items = self.__items
+            self.__items_shared = True
+            items, item_keys = self.__build_items()
             # now generate the insert/remove instructions to make the official
             # list match the proposed list.
             assert len(set(self._get_master_items())) == len(self._get_master_items())
@@ -555,13 +637,15 @@ class FilteredListModel(Observable.Observable):
             # easy testing.
             # import time
             # t0 = time.perf_counter()
-            self.begin_changes_event.fire(self.__items_key)
+            self.__item_keys = None
+            self.__begin_changes()
             if self.__items_sorted:
                 old_sort_reverse = self.__sort_reverse
-                sort_key = self.sort_key
-                if not sort_key:
+                if item_keys is not None:
+                    sort_key: SortKeyCallable = item_keys.__getitem__
+                else:
                     indexes = {item: index for index, item in enumerate(items)}
-                    sort_key = lambda x: indexes[x]
+                    sort_key = indexes.__getitem__
                     self.__sort_reverse = False
                 old_items_set = set(old_items)
                 new_items_set = set(items)
@@ -575,20 +659,25 @@ class FilteredListModel(Observable.Observable):
                 for item in insert_items_set:
                     self.__insert_item(item, sort_key)
                 self.__sort_reverse = old_sort_reverse
+            elif len(items) == len(old_items) and all(map(operator.is_, items, old_items)):
+                # not known to be sorted, but the items are unchanged and in the same order; nothing to replace.
+                pass
             else:
                 # requires sorting and not already sorted or not sorted: fall back to full replacement
                 for item in old_items:
                     # remove all items
                     self.__remove_item(item)
                 indexes = {item: index for index, item in enumerate(items)}
-                sort_key = lambda x: indexes[x]
+                sort_key = indexes.__getitem__
                 old_sort_reverse = self.__sort_reverse
                 self.__sort_reverse = False
                 for item in items:
                     self.__insert_item(item, sort_key)
                 self.__sort_reverse = old_sort_reverse
             self.__items_sorted = True
-            self.end_changes_event.fire(self.__items_key)
+            if item_keys is not None:
+                self.__item_keys = [item_keys[item] for item in self.__items]
+            self.__end_changes()
             # t1 = time.perf_counter()
             # print(f"{int(1000000 * (t1 - t0))}us {len(self.__items)}")
 
@@ -600,52 +689,60 @@ class FilteredListModel(Observable.Observable):
     # thread safe.
     @container.setter
     def container(self, container: typing.Optional[Observable.Observable]) -> None:
-        if self.__container:
-            self.__item_inserted_event_listener = None
-            self.__item_removed_event_listener = None
-            self.__begin_changes_event_listener = None
-            self.__end_changes_event_listener = None
-            self.__reset_list_event_listener = None
-            for item in reversed(copy.copy(self._get_master_items())):
-                self.__item_removed(self.__master_items_key, item, len(self._get_master_items()) - 1)
-        self.__container = container
-        self.__items_sorted = False
-        self.reset_list_event.fire(self.__items_key)
-        if self.__container:
-            self.__item_inserted_event_listener = self.__container.item_inserted_event.listen(weak_partial(FilteredListModel.__item_inserted, self))
-            self.__item_removed_event_listener = self.__container.item_removed_event.listen(weak_partial(FilteredListModel.__item_removed, self))
-            if hasattr(self.__container, "begin_changes_event") and hasattr(self.__container, "end_changes_event"):
-
-                def begin_changes(list_model: FilteredListModel, key: str) -> None:
-                    if key == list_model.__master_items_key:
-                        list_model.begin_changes_event.fire(list_model.__items_key)
-
-                def end_changes(list_model: FilteredListModel, key: str) -> None:
-                    if key == list_model.__master_items_key:
-                        list_model.end_changes_event.fire(list_model.__items_key)
-                    for selection in list_model.__selections:
-                        selection_copy = copy.copy(selection)
-                        for do_insert, index in list_model.__selection_changes:
-                            # adjust the selection copy for the new index, but don't add/remove the new index itself.
-                            # leaves the selected items the same.
-                            if do_insert:
-                                selection_copy.insert_index(index)
-                            else:
-                                selection_copy.remove_index(index)
-                        selection.set_multiple(selection_copy.indexes)
-                    list_model.__selection_changes = list()
-
-                self.__begin_changes_event_listener = self.__container.begin_changes_event.listen(weak_partial(begin_changes, self))
-                self.__end_changes_event_listener = self.__container.end_changes_event.listen(weak_partial(end_changes, self))
-            if hasattr(self.__container, "reset_list_event"):
-
-                def reset_list(list_model: FilteredListModel, key: str) -> None:
-                    list_model.__items_sorted = False
-                    list_model.reset_list_event.fire(list_model.__items_key)
-
-                self.__reset_list_event_listener = self.__container.reset_list_event.listen(weak_partial(reset_list, self))
-            for index, item in enumerate(getattr(self.__container, self.__master_items_key)):
-                self.__item_inserted(self.__master_items_key, item, index)
+        if container is self.__container:
+            return
+        # make the changes under a change so that the items are rebuilt once, rather than updated per item.
+        with self.changes():
+            if self.__container:
+                self.__item_inserted_event_listener = None
+                self.__item_removed_event_listener = None
+                self.__begin_changes_event_listener = None
+                self.__end_changes_event_listener = None
+                self.__reset_list_event_listener = None
+                # the end changes of an old container in the middle of a change will not arrive; end the changes here.
+                if self.__changes_event_level > 0:
+                    self.__changes_event_level = 1
+                    self.__end_changes()
+                for item in reversed(copy.copy(self._get_master_items())):
+                    self.__item_removed(self.__master_items_key, item, len(self._get_master_items()) - 1)
+            self.__container = container
+            self.__items_sorted = False
+            self.reset_list_event.fire(self.__items_key)
+            if self.__container:
+                self.__item_inserted_event_listener = self.__container.item_inserted_event.listen(weak_partial(FilteredListModel.__item_inserted, self))
+                self.__item_removed_event_listener = self.__container.item_removed_event.listen(weak_partial(FilteredListModel.__item_removed, self))
+                if hasattr(self.__container, "begin_changes_event") and hasattr(self.__container, "end_changes_event"):
+
+                    def begin_changes(list_model: FilteredListModel, key: str) -> None:
+                        if key == list_model.__master_items_key:
+                            list_model.__begin_changes()
+
+                    def end_changes(list_model: FilteredListModel, key: str) -> None:
+                        if key == list_model.__master_items_key:
+                            list_model.__end_changes()
+                        for selection in list_model.__selections:
+                            selection_copy = copy.copy(selection)
+                            for do_insert, index in list_model.__selection_changes:
+                                # adjust the selection copy for the new index, but don't add/remove the new index itself.
+                                # leaves the selected items the same.
+                                if do_insert:
+                                    selection_copy.insert_index(index)
+                                else:
+                                    selection_copy.remove_index(index)
+                            selection.set_multiple(selection_copy.indexes)
+                        list_model.__selection_changes = list()
+
+                    self.__begin_changes_event_listener = self.__container.begin_changes_event.listen(weak_partial(begin_changes, self))
+                    self.__end_changes_event_listener = self.__container.end_changes_event.listen(weak_partial(end_changes, self))
+                if hasattr(self.__container, "reset_list_event"):
+
+                    def reset_list(list_model: FilteredListModel, key: str) -> None:
+                        list_model.__items_sorted = False
+                        list_model.reset_list_event.fire(list_model.__items_key)
+
+                    self.__reset_list_event_listener = self.__container.reset_list_event.listen(weak_partial(reset_list, self))
+                for index, item in enumerate(getattr(self.__container, self.__master_items_key)):
+                    self.__item_inserted(self.__master_items_key, item, index)
 
     def make_selection(self) -> Selection.IndexedSelection:
         selection = Selection.IndexedSelection()
@@ -679,6 +776,7 @@ class FilteredListModel(Observable.Observable):
             with self._update_mutex:
                 del self.__master_items[index]
                 del self.__item_changed_event_listeners[index]
+                self.__filter_matches.pop(item, None)
                 self.__removed_master_item(index, item)
 
 
@@ -692,11 +790,12 @@ class MappedListModel(Observable.Observable):
                  selection: typing.Optional[Selection.IndexedSelection] = None) -> None:
         super().__init__()
         self.__container = None
-        self.__master_items_key = master_items_key or "items"
-        self.__items_key = items_key or self.__master_items_key
+        self.__master_items_key = sys.intern(master_items_key or "items")
+        self.__items_key = sys.intern(items_key or self.__master_items_key)
         self.__map_fn = map_fn or (lambda x: x)
         self.__unmap_fn = unmap_fn or (lambda x: x)
         self.__items: typing.List[typing.Any] = list()  # a list of transformed items
+        self.__items_shared = False
         self._update_mutex = threading.RLock()
         self.__change_level = 0
         self.begin_changes_event = Event.Event()
@@ -715,7 +814,7 @@ class MappedListModel(Observable.Observable):
 
     def begin_change(self) -> None:
         """ Begin a set of changes. Balance with end_changes. """
-        if self.__change_level == 0:
+        if self.__change_level == 0 and self.begin_changes_event.has_listeners:
             self.begin_changes_event.fire(self.__items_key)
         self.__change_level += 1
 
@@ -723,10 +822,12 @@ class MappedListModel(Observable.Observable):
         """ End a set of changes and update items if finished. """
         with self._update_mutex:
             self.__change_level -= 1
-            if self.__change_level == 0:
+            if self.__change_level == 0 and self.end_changes_event.has_listeners:
                 self.end_changes_event.fire(self.__items_key)
 
     class ChangeTracker:
+        __slots__ = ("list_model",)
+
         def __init__(self, list_model: MappedListModel):
             self.list_model = list_model
 
@@ -748,9 +849,16 @@ class MappedListModel(Observable.Observable):
 
     @property
     def items(self) -> typing.Sequence[typing.Any]:
-        """ Return the items. """
+        """ Return the items. The returned list must not be modified. """
         with self._update_mutex:
-            return copy.copy(self.__items)
+            self.__items_shared = True
+            return self.__items
+
+    def __get_mutable_items(self) -> typing.List[typing.Any]:
+        if self.__items_shared:
+            self.__items = list(self.__items)
+            self.__items_shared = False
+        return self.__items
 
     @property
     def items_key(self) -> str:
@@ -811,7 +919,7 @@ class MappedListModel(Observable.Observable):
         if key == self.__master_items_key:
             with self._update_mutex:
                 mapped_item = self.__map_fn(item)
-                self.__items.insert(before_index, mapped_item)
+                self.__get_mutable_items().insert(before_index, mapped_item)
                 self.notify_insert_item(self.__items_key, mapped_item, before_index)
                 for selection in self.__selections:
                     selection.insert_index(before_index)
@@ -824,7 +932,7 @@ class MappedListModel(Observable.Observable):
                 mapped_item = self.__items[index]
                 if callable(self.__unmap_fn):
                     self.__unmap_fn(mapped_item)
-                del self.__items[index]
+                del self.__get_mutable_items()[index]
                 self.notify_remove_item(self.__items_key, mapped_item, index)
                 for selection in self.__selections:
                     selection.remove_index(index)
@@ -841,11 +949,14 @@ class FlattenedListModel(Observable.Observable):
                  selection: typing.Optional[Selection.IndexedSelection] = None) -> None:
         super().__init__()
         self.__container = None
-        self.__master_items_key = master_items_key
-        self.__child_items_key = child_items_key or "items"
-        self.__items_key = items_key or self.__child_items_key
+        self.__master_items_key = sys.intern(master_items_key)
+        self.__child_items_key = sys.intern(child_items_key or "items")
+        self.__items_key = sys.intern(items_key or self.__child_items_key)
+        self.__get_master_items = operator.attrgetter(self.__master_items_key)
+        self.__get_child_items = operator.attrgetter(self.__child_items_key)
         self.__master_items : typing.List[typing.Any] = list()  # a list of master items (to be transformed)
         self.__items : typing.List[typing.Any] = list()  # a list of flattened items
+        self.__items_shared = False
         self.__children: typing.Dict[typing.Any, typing.List[typing.Any]] = dict()  # map master item to children
         self._update_mutex = threading.RLock()
         self.__item_inserted_event_listener = None
@@ -862,9 +973,16 @@ class FlattenedListModel(Observable.Observable):
 
     @property
     def items(self) -> typing.Sequence[typing.Any]:
-        """ Return the items. """
+        """ Return the items. The returned list must not be modified. """
         with self._update_mutex:
-            return copy.copy(self.__items)
+            self.__items_shared = True
+            return self.__items
+
+    def __get_mutable_items(self) -> typing.List[typing.Any]:
+        if self.__items_shared:
+            self.__items = list(self.__items)
+            self.__items_shared = False
+        return self.__items
 
     def __getattr__(self, item: str) -> typing.Any:
         if item == self.__items_key:
@@ -883,14 +1001,14 @@ class FlattenedListModel(Observable.Observable):
         if self.__container:
             self.__item_inserted_event_listener = None
             self.__item_removed_event_listener = None
-            for item in reversed(copy.copy(getattr(self.__container, self.__master_items_key))):
+            for item in reversed(copy.copy(self.__get_master_items(self.__container))):
                 self.__master_item_removed(self.__master_items_key, item, len(self.__master_items) - 1)
         # add new master items
         self.__container = container
         if self.__container:
             self.__item_inserted_event_listener = self.__container.item_inserted_event.listen(weak_partial(FlattenedListModel.__master_item_inserted, self))
             self.__item_removed_event_listener = self.__container.item_removed_event.listen(weak_partial(FlattenedListModel.__master_item_removed, self))
-            for index, item in enumerate(getattr(self.__container, self.__master_items_key)):
+            for index, item in enumerate(self.__get_master_items(self.__container)):
                 self.__master_item_inserted(self.__master_items_key, item, index)
 
     def make_selection(self) -> Selection.IndexedSelection:
@@ -911,10 +1029,13 @@ class FlattenedListModel(Observable.Observable):
                 assert not item in self.__master_items, "master item already in " + str(self.__master_items_key) + " (" + str(self.__items_key) + " / " + str(self.__child_items_key) + ")"
                 # print(f"{self} inserted {item} {before_index} ({len(getattr(item, self.__child_items_key))})")
                 self.__master_items.insert(before_index, item)
+                self.__children[item] = list()
                 self.__child_item_inserted_event_listener[item] = item.item_inserted_event.listen(weak_partial(FlattenedListModel.__child_item_inserted, self, item))
                 self.__child_item_removed_event_listener[item] = item.item_removed_event.listen(weak_partial(FlattenedListModel.__child_item_removed, self, item))
-                for index, child_item in enumerate(getattr(item, self.__child_items_key)):
-                    self.__child_item_inserted(item, self.__child_items_key, child_item, index)
+                # the children are inserted consecutively, so compute the master offset once for all of them.
+                master_offset = self.__get_master_offset(item)
+                for index, child_item in enumerate(self.__get_child_items(item)):
+                    self.__insert_child_item(item, child_item, index, master_offset)
 
     # thread safe.
     def __master_item_removed(self, key: str, item: typing.Any, index: int) -> None:
@@ -923,38 +1044,39 @@ class FlattenedListModel(Observable.Observable):
         # remove listeners for child items.
         if key == self.__master_items_key:
             with self._update_mutex:
-                for index_, child_item in reversed(list(enumerate(getattr(item, self.__child_items_key)))):
+                for index_, child_item in reversed(list(enumerate(self.__get_child_items(item)))):
                     self.__child_item_removed(item, self.__child_items_key, child_item, index_)
                 # print(f"{self} removed {item} {index} ({len(getattr(item, self.__child_items_key))})")
                 del self.__master_items[index]
+                del self.__children[item]
                 del self.__child_item_inserted_event_listener[item]
                 del self.__child_item_removed_event_listener[item]
                 assert not item in self.__master_items, "master item still in " + str(self.__master_items_key) + " (" + str(self.__items_key) + " / " + str(self.__child_items_key) + ")"
 
+    def __get_master_offset(self, master_item: typing.Any) -> int:
+        # return the index of the first child of the master item in the flattened items.
+        # every master item has a children list, so the sum can be done with builtins rather than a python loop.
+        master_items = self.__master_items
+        master_index = master_items.index(master_item)
+        return sum(map(len, map(self.__children.__getitem__, master_items[:master_index])))
+
+    def __insert_child_item(self, master_item: typing.Any, item: typing.Any, before_index: int, master_offset: int) -> None:
+        master_index = master_offset + before_index
+        self.__children[master_item].insert(before_index, item)
+        self.__get_mutable_items().insert(master_index, item)
+        self.notify_insert_item(self.__items_key, item, master_index)
+        for selection in self.__selections:
+            selection.insert_index(before_index)
+
     def __child_item_inserted(self, master_item: typing.Any, key: str, item: typing.Any, before_index: int) -> None:
         if key == self.__child_items_key:
-            master_index = 0
-            for master_item_ in self.__master_items:
-                if master_item_ == master_item:
-                    break
-                master_index += len(self.__children.get(master_item_, list()))
-            master_index += before_index
-            self.__children.setdefault(master_item, list()).insert(before_index, item)
-            self.__items.insert(master_index, item)
-            self.notify_insert_item(self.__items_key, item, master_index)
-            for selection in self.__selections:
-                selection.insert_index(before_index)
+            self.__insert_child_item(master_item, item, before_index, self.__get_master_offset(master_item))
 
     def __child_item_removed(self, master_item: typing.Any, key: str, item: typing.Any, index: int) -> None:
         if key == self.__child_items_key:
-            master_index = 0
-            for master_item_ in self.__master_items:
-                if master_item_ == master_item:
-                    break
-                master_index += len(self.__children.get(master_item_, list()))
-            master_index += index
+            master_index = self.__get_master_offset(master_item) + index
             del self.__children[master_item][index]
-            del self.__items[master_index]
+            del self.__get_mutable_items()[master_index]
             self.notify_remove_item(self.__items_key, item, master_index)
             for selection in self.__selections:
                 selection.remove_index(master_index)
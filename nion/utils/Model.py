@@ -47,16 +47,15 @@ class PropertyModel(Observable.Observable, typing.Generic[T]):
 
     @value.setter
     def value(self, value: typing.Optional[T]) -> None:
-        if self.__value is None:
-            not_equal = value is not None
-        elif value is None:
-            not_equal = self.__value is not None
-        else:
-            not_equal = not self.__cmp(value, self.__value)
-        if not_equal:
+        current_value = self.__value
+        # identity covers the common unchanged case (including None/None) without calling the comparator.
+        if current_value is value:
+            return
+        if current_value is None or value is None or not self.__cmp(value, current_value):
             self._set_value(value)
-            if self.on_value_changed:
-                self.on_value_changed(value)
+            on_value_changed = self.on_value_changed
+            if on_value_changed:
+                on_value_changed(value)
 
     def _set_value(self, value: typing.Optional[T]) -> None:
         self.__value = value
@@ -64,41 +63,51 @@ class PropertyModel(Observable.Observable, typing.Generic[T]):
 
 
 class FuncStreamValueModel(PropertyModel[T], typing.Generic[T]):
-    """Converts a stream of functions to a property model, evaluated asynchronously, on a thread."""
+    """Converts a stream of functions to a property model, evaluated asynchronously, on a thread.
+
+    Pass inline=True to evaluate cheap functions directly on the event loop instead of on a thread. Inline functions
+    must not block.
+    """
 
     def __init__(self, value_func_stream: Stream.AbstractStream[typing.Callable[[], T]],
                  event_loop: asyncio.AbstractEventLoop, value: typing.Optional[T] = None,
-                 cmp: typing.Optional[EqualityOperator] = None):
+                 cmp: typing.Optional[EqualityOperator] = None, *, inline: bool = False):
         super().__init__(value=value, cmp=cmp)
         self.__value_func_stream = value_func_stream
         self.__event_loop = event_loop
         self.__pending_task = Stream.StreamTask(None, event_loop)
-        self.__value_fn_ref: typing.List[typing.Callable[[], typing.Any]] = [lambda: None]
-        self.__event = asyncio.Event()
-        self.__evaluating = [False]
+        self.__state = _FuncStreamEvaluationState(event_loop)
 
         # Python 3.9: use ReferenceType[FuncStreamValueModel] for model_ref
-        async def update_value(event: asyncio.Event, evaluating: typing.List[bool], model_ref: typing.Any, value_fn_ref: typing.Sequence[typing.Callable[[], typing.Any]]) -> None:
+        async def update_value(state: _FuncStreamEvaluationState, model_ref: typing.Any) -> None:
             while True:
-                await event.wait()
-                evaluating[0] = True
-                event.clear()
-                value = None
-
-                def eval() -> None:
-                    nonlocal value
-                    try:
-                        value = value_fn_ref[0]()
-                    except Exception as e:
-                        pass
-
-                await event_loop.run_in_executor(None, eval)
-                model = model_ref()
-                if model:
-                    model.value = value
-                evaluating[0] = event.is_set()
-
-        self.__pending_task.create_task(update_value(self.__event, self.__evaluating, weakref.ref(self), self.__value_fn_ref))
+                await state.wake
+                state.wake = event_loop.create_future()
+                state.evaluating = True
+                # requests arriving during an evaluation only mark the state dirty; they coalesce into one more pass.
+                while state.dirty:
+                    state.dirty = False
+                    value_fn = state.value_fn
+                    value = None
+
+                    def eval() -> None:
+                        nonlocal value
+                        try:
+                            value = value_fn()
+                        except Exception as e:
+                            pass
+
+                    if inline:
+                        eval()
+                    else:
+                        await event_loop.run_in_executor(None, eval)
+                    model = model_ref()
+                    if model:
+                        model.value = value
+                    model = None
+                state.finish()
+
+        self.__pending_task.create_task(update_value(self.__state, weakref.ref(self)))
         self.__stream_listener = value_func_stream.value_stream.listen(weak_partial(FuncStreamValueModel.__handle_value_func, self))
         value_func = self.__value_func_stream.value
         if value_func:
@@ -110,11 +119,14 @@ class FuncStreamValueModel(PropertyModel[T], typing.Generic[T]):
         weakref.finalize(self, finalize, self.__pending_task)
 
     def _run_until_complete(self) -> None:
-        while True:
+        state = self.__state
+        if state.dirty or state.evaluating:
+            state.idle = self.__event_loop.create_future()
+            self.__event_loop.run_until_complete(state.idle)
+        else:
+            # nothing to wait for, but still run one pass of the loop so other scheduled callbacks are processed.
             self.__event_loop.stop()
             self.__event_loop.run_forever()
-            if not self.__evaluating[0]:
-                break
 
     def _evaluate_immediate(self) -> typing.Optional[T]:
         value_func = self.__value_func_stream.value
@@ -122,8 +134,36 @@ class FuncStreamValueModel(PropertyModel[T], typing.Generic[T]):
         return value_func()
 
     def __handle_value_func(self, value_func: typing.Callable[[], typing.Any]) -> None:
-        self.__value_fn_ref[0] = value_func
-        self.__event.set()
+        self.__state.request(value_func)
+
+
+class _FuncStreamEvaluationState:
+    """Evaluation state shared between a FuncStreamValueModel and its update task.
+
+    Requests store the latest value function, set the dirty flag, and wake the task; the task keeps evaluating until
+    no longer dirty, then completes the idle future, if any, to release a caller waiting for evaluation to finish.
+    """
+    __slots__ = ("value_fn", "dirty", "evaluating", "wake", "idle")
+
+    def __init__(self, event_loop: asyncio.AbstractEventLoop) -> None:
+        self.value_fn: typing.Callable[[], typing.Any] = lambda: None
+        self.dirty = False
+        self.evaluating = False
+        self.wake: asyncio.Future[None] = event_loop.create_future()
+        self.idle: typing.Optional[asyncio.Future[None]] = None
+
+    def finish(self) -> None:
+        self.evaluating = False
+        idle = self.idle
+        if idle and not idle.done():
+            idle.set_result(None)
+        self.idle = None
+
+    def request(self, value_fn: typing.Callable[[], typing.Any]) -> None:
+        self.value_fn = value_fn
+        self.dirty = True
+        if not self.wake.done():
+            self.wake.set_result(None)
 
 
 class StreamValueModel(PropertyModel[T], typing.Generic[T]):
@@ -154,16 +194,31 @@ class PropertyChangedPropertyModel(PropertyModel[T], typing.Generic[T]):
         super().__init__(getattr(observable, property_name, None))
         self.__observable = observable
         self.__property_name = property_name
+        self.__suppress = False
+        self.__notified = False
 
         def property_changed(property_model: PropertyChangedPropertyModel[T], observable: Observable.Observable, property_name: str, property_name_: str) -> None:
             # check if changed property matches property name for this object
             if property_name_ == property_name:
-                property_model.value = getattr(observable, property_name)
+                # changes which originate from setting the property in _set_value are only noted.
+                if property_model.__suppress:
+                    property_model.__notified = True
+                else:
+                    property_model.value = getattr(observable, property_name)
 
         self.__listener = self.__observable.property_changed_event.listen(weak_partial(property_changed, self, observable, property_name))
 
     def _set_value(self, value: typing.Optional[T]) -> None:
         super()._set_value(value)
-        # set the property on the observed object. this will trigger a property changed, but will be ignored since
-        # the value doesn't change.
-        setattr(self.__observable, self.__property_name, value)
+        # set the property on the observed object. the resulting property changed is suppressed.
+        self.__suppress = True
+        self.__notified = False
+        try:
+            setattr(self.__observable, self.__property_name, value)
+        finally:
+            self.__suppress = False
+        # if the observed object notified, it may have adjusted the value (for instance clamping it); adopt it. the
+        # value setter ignores an equal value.
+        if self.__notified:
+            self.__notified = False
+            self.value = getattr(self.__observable, self.__property_name)
@@ -24,6 +24,8 @@ class Observable:
     """
         Provide basic observable object. Sub classes should implement properties,
         items, and collections and call appropriate notifications when necessary.
+
+        Notifications check whether the event has listeners before firing, so unobserved changes are cheap.
     """
 
     def __init__(self) -> None:
@@ -38,25 +40,41 @@ class Observable:
         self.item_content_changed_event = Event.Event()
 
     def notify_property_changed(self, key: str) -> None:
-        self.property_changed_event.fire(key)
+        property_changed_event = self.property_changed_event
+        if property_changed_event.has_listeners:
+            property_changed_event.fire(key)
 
     def notify_set_item(self, key: str, item: typing.Any) -> None:
-        self.item_set_event.fire(key, item)
+        item_set_event = self.item_set_event
+        if item_set_event.has_listeners:
+            item_set_event.fire(key, item)
 
     def notify_clear_item(self, key: str) -> None:
-        self.item_cleared_event.fire(key)
+        item_cleared_event = self.item_cleared_event
+        if item_cleared_event.has_listeners:
+            item_cleared_event.fire(key)
 
     def notify_insert_item(self, key: str, value: typing.Any, before_index: int) -> None:
-        self.item_inserted_event.fire(key, value, before_index)
+        item_inserted_event = self.item_inserted_event
+        if item_inserted_event.has_listeners:
+            item_inserted_event.fire(key, value, before_index)
 
     def notify_remove_item(self, key: str, value: typing.Any, index: int) -> None:
-        self.item_removed_event.fire(key, value, index)
+        item_removed_event = self.item_removed_event
+        if item_removed_event.has_listeners:
+            item_removed_event.fire(key, value, index)
 
     def notify_add_item(self, key: str, value: typing.Any) -> None:
-        self.item_added_event.fire(key, value)
+        item_added_event = self.item_added_event
+        if item_added_event.has_listeners:
+            item_added_event.fire(key, value)
 
     def notify_discard_item(self, key: str, value: typing.Any) -> None:
-        self.item_discarded_event.fire(key, value)
+        item_discarded_event = self.item_discarded_event
+        if item_discarded_event.has_listeners:
+            item_discarded_event.fire(key, value)
 
     def notify_item_content_changed(self, key: str, value: typing.Any, index: int) -> None:
-        self.item_content_changed_event.fire(key, value, index)
+        item_content_changed_event = self.item_content_changed_event
+        if item_content_changed_event.has_listeners:
+            item_content_changed_event.fire(key, value, index)
@@ -1,51 +1,103 @@
+from __future__ import annotations
+
 import abc
-import collections
 import copy
+import operator
 import typing
 import weakref
 
 from . import Observable
 
-from .ReferenceCounting import weak_partial
-
 
 AccessorType = typing.Callable[[typing.Any], typing.Any]
 
 
+class _IndexCell:
+    """A mutable index shared between an index accessor and the recorder tracking its position."""
+    __slots__ = ("v",)
+
+    def __init__(self, v: int) -> None:
+        self.v = v
+
+
 class Accessor(abc.ABC):
+    __slots__ = ()
+
     @abc.abstractmethod
     def get(self, o: Observable.Observable) -> typing.Any: ...
 
+    def freeze(self) -> Accessor:
+        """Return an accessor which is not affected by later changes to shared index cells."""
+        return self
 
-class DirectAccessor(Accessor):
-    def get(self, o: Observable.Observable) -> typing.Any:
-        return o
 
+# path steps are (op, arg) pairs: "k" gets an attribute, "i" gets an index, "c" gets the index held in an _IndexCell,
+# "a" applies another accessor (one which is not a path accessor) to the root.
+PathStep = typing.Tuple[str, typing.Any]
 
-class KeyAccessor(Accessor):
-    def __init__(self, accessor: Accessor, key: str) -> None:
-        self.accessor = accessor
-        self.key = key
+
+class PathAccessor(Accessor):
+    """Access an object from a root object by walking a precomputed path of steps."""
+    __slots__ = ("steps", "__needs_freeze")
+
+    def __init__(self, steps: typing.Tuple[PathStep, ...] = tuple()) -> None:
+        self.steps = steps
+        self.__needs_freeze = any(op in ("c", "a") for op, a in steps)
 
     def get(self, o: Observable.Observable) -> typing.Any:
-        return getattr(self.accessor.get(o), self.key)
+        item: typing.Any = o
+        for op, a in self.steps:
+            if op == "k":
+                item = getattr(item, a)
+            elif op == "i":
+                item = item[a]
+            elif op == "c":
+                item = item[a.v]
+            else:
+                item = a.get(item)
+        return item
 
+    def freeze(self) -> Accessor:
+        if not self.__needs_freeze:
+            return self
+        return PathAccessor(tuple(("i", a.v) if op == "c" else ("a", a.freeze()) if op == "a" else (op, a) for op, a in self.steps))
 
-class IndexAccessor(Accessor):
-    def __init__(self, accessor: Accessor, index: int) -> None:
-        self.accessor = accessor
-        self.index = index
 
-    def get(self, o: Observable.Observable) -> typing.Any:
-        return self.accessor.get(o)[self.index]
+def _steps(accessor: Accessor) -> typing.Tuple[PathStep, ...]:
+    return accessor.steps if isinstance(accessor, PathAccessor) else (("a", accessor),)
+
+
+def _is_same_path(a: Accessor, b: typing.Optional[Accessor]) -> bool:
+    # frozen accessors for the same path are often distinct objects, so compare the steps too.
+    return a is b or (isinstance(a, PathAccessor) and isinstance(b, PathAccessor) and a.steps == b.steps)
+
+
+# the direct accessor has no steps and no state, so a single instance is shared.
+_direct_accessor = PathAccessor()
+
+
+def DirectAccessor() -> PathAccessor:
+    return _direct_accessor
+
+
+def KeyAccessor(accessor: Accessor, key: str) -> PathAccessor:
+    return PathAccessor(_steps(accessor) + (("k", key),))
+
+
+def IndexAccessor(accessor: Accessor, index: typing.Union[int, _IndexCell]) -> PathAccessor:
+    return PathAccessor(_steps(accessor) + (("c", index) if isinstance(index, _IndexCell) else ("i", index),))
 
 
 class RecorderEntry(abc.ABC):
+    __slots__ = ()
+
     @abc.abstractmethod
     def apply(self, o: Observable.Observable) -> None: ...
 
 
 class KeyRecorderEntry(RecorderEntry):
+    __slots__ = ("accessor", "key", "item")
+
     def __init__(self, accessor: Accessor, key: str, item: typing.Any) -> None:
         self.accessor = accessor
         self.key = key
@@ -56,6 +108,8 @@ class KeyRecorderEntry(RecorderEntry):
 
 
 class InsertRecorderEntry(RecorderEntry):
+    __slots__ = ("accessor", "key", "index", "item")
+
     def __init__(self, accessor: Accessor, key: str, index: int, item: typing.Any) -> None:
         self.accessor = accessor
         self.key = key
@@ -67,13 +121,16 @@ class InsertRecorderEntry(RecorderEntry):
 
 
 class RemoveRecorderEntry(RecorderEntry):
+    __slots__ = ("accessor", "key", "index")
+
     def __init__(self, accessor: Accessor, key: str, index: int) -> None:
         self.accessor = accessor
         self.key = key
         self.index = index
 
     def apply(self, o: Observable.Observable) -> None:
-        self.accessor.get(o).remove_item(self.key, getattr(self.accessor.get(o), self.key)[self.index])
+        target = self.accessor.get(o)
+        target.remove_item(self.key, getattr(target, self.key)[self.index])
 
 
 class RecorderLogger:
@@ -84,8 +141,66 @@ class RecorderLogger:
         self.__items.append(recorder_entry)
 
     def apply(self, object: Observable.Observable) -> None:
+        # runs of property entries for the same path resolve their target once. other entries may change what a path
+        # resolves to, so they end the run.
+        target_accessor: typing.Optional[Accessor] = None
+        target: typing.Any = None
         for logger_item in self.__items:
-            logger_item.apply(object)
+            if type(logger_item) is KeyRecorderEntry:
+                accessor = logger_item.accessor
+                if not _is_same_path(accessor, target_accessor):
+                    target = accessor.get(object)
+                    target_accessor = accessor
+                setattr(target, logger_item.key, logger_item.item)
+            else:
+                target_accessor = None
+                logger_item.apply(object)
+
+
+def _get_attributes(object: typing.Any, names: typing.Tuple[str, ...]) -> typing.Tuple[typing.Any, ...]:
+    # attrgetter fetches all attributes in one call, but returns a bare value for a single name.
+    if not names:
+        return tuple()
+    values = operator.attrgetter(*names)(object)
+    return values if len(names) > 1 else (values,)
+
+
+class _RecorderHandlers:
+    """Event handlers for a recorder.
+
+    Holds weak references to the recorder and the observed object so listeners do not keep either alive.
+    """
+    __slots__ = ("_r", "_obj_ref")
+
+    def __init__(self, recorder: Recorder, object: typing.Any) -> None:
+        self._r = weakref.ref(recorder)
+        self._obj_ref = weakref.ref(object)
+
+    def on_property_changed(self, key: str) -> None:
+        recorder = self._r()
+        object = self._obj_ref()
+        if recorder and object:
+            recorder._property_changed(object, key)
+
+    def on_item_set(self, key: str, item: typing.Any) -> None:
+        recorder = self._r()
+        if recorder:
+            recorder._item_set(key, item)
+
+    def on_item_cleared(self, key: str) -> None:
+        recorder = self._r()
+        if recorder:
+            recorder._item_set(key, None)
+
+    def on_item_inserted(self, key: str, value: typing.Any, before_index: int) -> None:
+        recorder = self._r()
+        if recorder:
+            recorder._item_inserted(key, value, before_index)
+
+    def on_item_removed(self, key: str, value: typing.Any, item_index: int) -> None:
+        recorder = self._r()
+        if recorder:
+            recorder._item_removed(key, value, item_index)
 
 
 class Recorder:
@@ -100,23 +215,52 @@ class Recorder:
     # TODO: thread safety
 
     def __init__(self, object: typing.Any, accessor: typing.Optional[Accessor] = None, logger: typing.Optional[RecorderLogger] = None) -> None:
-        self.__accessor = accessor or DirectAccessor()
-        self.__logger: RecorderLogger = logger if logger is not None else RecorderLogger()
-        self.__property_changed_event_listener = object.property_changed_event.listen(weak_partial(Recorder.__property_changed, self, weakref.ref(object)))
-        self.__item_set_event_listener = object.item_set_event.listen(weak_partial(Recorder.__item_set, self))
-        self.__item_cleared_event_listener = object.item_cleared_event.listen(weak_partial(Recorder.__item_cleared, self))
-        self.__item_inserted_event_listener = object.item_inserted_event.listen(weak_partial(Recorder.__item_inserted, self))
-        self.__item_removed_event_listener = object.item_removed_event.listen(weak_partial(Recorder.__item_removed, self))
+        self.__bind(object, accessor or DirectAccessor(), logger if logger is not None else RecorderLogger())
+        # build the recorders for the descendants using a work list rather than recursing through __init__.
+        stack: typing.List[typing.Tuple[Recorder, typing.Any]] = [(self, object)]
+        while stack:
+            recorder, o = stack.pop()
+            recorder.__bind_children(o, stack)
+
+    def __bind(self, object: typing.Any, accessor: Accessor, logger: RecorderLogger) -> None:
+        self.__accessor = accessor
+        self.__logger = logger
+        # resolve the static set of recordable keys once; it is preferred over the predicate.
+        recordable_keys = getattr(object, "_persistent_property_keys", None)
+        self.__recordable_keys: typing.Optional[typing.FrozenSet[str]] = frozenset(recordable_keys) if recordable_keys is not None else None
+        # the listeners call bound methods of the handlers; the handlers only hold weak references back to this recorder.
+        self.__handlers = handlers = _RecorderHandlers(self, object)
+        self.__property_changed_event_listener = object.property_changed_event.listen(handlers.on_property_changed)
+        self.__item_set_event_listener = object.item_set_event.listen(handlers.on_item_set)
+        self.__item_cleared_event_listener = object.item_cleared_event.listen(handlers.on_item_cleared)
+        self.__item_inserted_event_listener = object.item_inserted_event.listen(handlers.on_item_inserted)
+        self.__item_removed_event_listener = object.item_removed_event.listen(handlers.on_item_removed)
         self.__item_recorders: typing.Dict[str, Recorder] = dict()
-        self.__relationship_recorders = collections.defaultdict(list)
-        for key in object.item_names:
-            item = getattr(object, key)
+        # each relationship recorder is paired with the index cell used by its accessor so shifts only update the cell.
+        self.__relationship_recorders: typing.Dict[str, typing.List[typing.Tuple[_IndexCell, Recorder]]] = dict()
+
+    def __bind_children(self, object: typing.Any, stack: typing.List[typing.Tuple[Recorder, typing.Any]]) -> None:
+        # create and bind the child recorders; the caller binds their children in turn.
+        accessor = self.__accessor
+        logger = self.__logger
+        item_names = tuple(object.item_names)
+        for key, item in zip(item_names, _get_attributes(object, item_names)):
             if item:
-                self.__item_recorders[key] = Recorder(item, KeyAccessor(self.__accessor, key), self.__logger)
-        for key in object.relationship_names:
-            items = getattr(object, key)
+                recorder = Recorder.__new__(Recorder)
+                recorder.__bind(item, KeyAccessor(accessor, key), logger)
+                self.__item_recorders[key] = recorder
+                stack.append((recorder, item))
+        relationship_names = tuple(object.relationship_names)
+        for key, items in zip(relationship_names, _get_attributes(object, relationship_names)):
+            if not items:
+                continue
+            relationship_recorders = self.__relationship_recorders.setdefault(key, list())
             for index, item in enumerate(items):
-                self.__relationship_recorders[key].append(Recorder(item, IndexAccessor(KeyAccessor(self.__accessor, key), index), self.__logger))
+                cell = _IndexCell(index)
+                recorder = Recorder.__new__(Recorder)
+                recorder.__bind(item, IndexAccessor(KeyAccessor(accessor, key), cell), logger)
+                relationship_recorders.append((cell, recorder))
+                stack.append((recorder, item))
 
     def close(self) -> None:
         pass
@@ -132,35 +276,38 @@ class Recorder:
     def _accessor(self, value: Accessor) -> None:
         self.__accessor = value
 
-    # Python 3.9+: o_ref: weakref.ReferenceType[typing.Any]
-    def __property_changed(self, o_ref: typing.Any, key: str) -> None:
-        object = o_ref()
-        if object:
-            if not hasattr(object, "_is_persistent_property_recordable") or object._is_persistent_property_recordable(key):
-                self._append_recorder_entry(KeyRecorderEntry(self.__accessor, key, getattr(object, key)))
-
-    def __item_set(self, key: str, item: typing.Any) -> None:
+    def _property_changed(self, object: typing.Any, key: str) -> None:
+        recordable_keys = self.__recordable_keys
+        if recordable_keys is not None:
+            if key not in recordable_keys:
+                return
+        else:
+            # the predicate is looked up on the object each time so the recorder does not hold a reference to it.
+            is_recordable = getattr(object, "_is_persistent_property_recordable", None)
+            if is_recordable is not None and not is_recordable(key):
+                return
+        self._append_recorder_entry(KeyRecorderEntry(self.__accessor.freeze(), key, getattr(object, key)))
+
+    def _item_set(self, key: str, item: typing.Any) -> None:
         self.__item_recorders.pop(key)
         if item:
             self.__item_recorders[key] = Recorder(item, KeyAccessor(self.__accessor, key), self.__logger)
-        self._append_recorder_entry(KeyRecorderEntry(self.__accessor, key, copy.deepcopy(item)))
-
-    def __item_cleared(self, key: str) -> None:
-        self.__item_set(key, None)
-
-    def __item_inserted(self, key: str, value: typing.Any, before_index: int) -> None:
-        for index, relationship_recorder in enumerate(self.__relationship_recorders[key]):
-            if index >= before_index:
-                relationship_recorder._accessor = IndexAccessor(KeyAccessor(self.__accessor, key), index + 1)
-        self.__relationship_recorders[key].insert(before_index, Recorder(value, IndexAccessor(KeyAccessor(self.__accessor, key), before_index), self.__logger))
-        self._append_recorder_entry(InsertRecorderEntry(self.__accessor, key, before_index, copy.deepcopy(value)))
-
-    def __item_removed(self, key: str, value: typing.Any, item_index: int) -> None:
-        for index, relationship_recorder in enumerate(self.__relationship_recorders[key]):
-            if index > item_index:
-                relationship_recorder._accessor = IndexAccessor(KeyAccessor(self.__accessor, key), index - 1)
-        self.__relationship_recorders[key].pop(item_index)
-        self._append_recorder_entry(RemoveRecorderEntry(self.__accessor, key, item_index))
+        self._append_recorder_entry(KeyRecorderEntry(self.__accessor.freeze(), key, copy.deepcopy(item)))
+
+    def _item_inserted(self, key: str, value: typing.Any, before_index: int) -> None:
+        relationship_recorders = self.__relationship_recorders.setdefault(key, list())
+        for index in range(before_index, len(relationship_recorders)):
+            relationship_recorders[index][0].v = index + 1
+        cell = _IndexCell(before_index)
+        relationship_recorders.insert(before_index, (cell, Recorder(value, IndexAccessor(KeyAccessor(self.__accessor, key), cell), self.__logger)))
+        self._append_recorder_entry(InsertRecorderEntry(self.__accessor.freeze(), key, before_index, copy.deepcopy(value)))
+
+    def _item_removed(self, key: str, value: typing.Any, item_index: int) -> None:
+        relationship_recorders = self.__relationship_recorders[key]
+        relationship_recorders.pop(item_index)
+        for index in range(item_index, len(relationship_recorders)):
+            relationship_recorders[index][0].v = index
+        self._append_recorder_entry(RemoveRecorderEntry(self.__accessor.freeze(), key, item_index))
 
     def _append_recorder_entry(self, recorder_entry: RecorderEntry) -> None:
         self.__logger.append(recorder_entry)
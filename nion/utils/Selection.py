@@ -102,14 +102,16 @@ class IndexedSelection:
         return indexes
 
     def clear(self) -> None:
-        old_index = copy.copy(self.__indexes)
+        # changes are detected without copying the indexes, which may be large.
         if self.selection_style == Style.single:
+            changed = 0 not in self.__indexes
             self.__indexes.add(0)
             self.__anchor_index = 0
         else:
+            changed = len(self.__indexes) > 0
             self.__indexes = set()
             self.__anchor_index = None
-        if old_index != self.__indexes:
+        if changed:
             self.__fire_changed_event()
 
     def __fire_changed_event(self) -> None:
@@ -125,11 +127,10 @@ class IndexedSelection:
         if self.selection_style in (Style.single, Style.single_or_none):
             self.set(index)
         elif self.selection_style in (Style.multiple, ):
-            old_index = copy.copy(self.__indexes)
-            self.__indexes.add(index)
-            if len(old_index) == 0:
-                self.__anchor_index = index
-            if old_index != self.__indexes:
+            if index not in self.__indexes:
+                if len(self.__indexes) == 0:
+                    self.__anchor_index = index
+                self.__indexes.add(index)
                 self.__fire_changed_event()
         else:
             self.clear()
@@ -137,12 +138,10 @@ class IndexedSelection:
     def remove(self, index: int) -> None:
         assert isinstance(index, numbers.Integral)
         if self.selection_style in (Style.multiple, Style.single_or_none):
-            old_index = copy.copy(self.__indexes)
             self.__indexes.remove(index)
             if not self.__anchor_index in self.__indexes:
                 self.__update_anchor_index()
-            if old_index != self.__indexes:
-                self.__fire_changed_event()
+            self.__fire_changed_event()
         elif self.selection_style in (Style.single, ):
             pass
         else:
@@ -154,11 +153,11 @@ class IndexedSelection:
 
     def set_multiple(self, indexes: typing.Set[int]) -> None:
         if self.selection_style in (Style.multiple, ):
-            old_index = copy.copy(self.__indexes)
-            self.__indexes = set()
-            self.__indexes.update(indexes)
-            self.__anchor_index = list(indexes)[0] if len(indexes) > 0 else None
-            if old_index != self.__indexes:
+            new_indexes = set(indexes)
+            changed = new_indexes != self.__indexes
+            self.__indexes = new_indexes
+            self.__anchor_index = next(iter(indexes)) if len(indexes) > 0 else None
+            if changed:
                 self.__fire_changed_event()
         elif self.selection_style in (Style.single, Style.single_or_none) and len(indexes) == 1:
             self.set(list(indexes)[0])
@@ -168,11 +167,10 @@ class IndexedSelection:
     def set(self, index: int) -> None:
         assert isinstance(index, numbers.Integral)
         if self.selection_style in (Style.multiple, Style.single, Style.single_or_none):
-            old_index = copy.copy(self.__indexes)
-            self.__indexes = set()
-            self.__indexes.add(index)
+            changed = len(self.__indexes) != 1 or index not in self.__indexes
+            self.__indexes = {index}
             self.__anchor_index = index
-            if old_index != self.__indexes:
+            if changed:
                 self.__fire_changed_event()
         else:
             self.clear()
@@ -187,18 +185,17 @@ class IndexedSelection:
     def extend(self, index: int) -> None:
         assert isinstance(index, numbers.Integral)
         if self.selection_style in (Style.multiple, ):
-            old_index = copy.copy(self.__indexes)
+            # extending only adds indexes, so the selection changed if its size changed.
+            old_count = len(self.__indexes)
             if self.__anchor_index is not None:
                 if index > self.__anchor_index:
-                    for new_index in range(self.__anchor_index, index + 1):
-                        self.__indexes.add(new_index)
+                    self.__indexes.update(range(self.__anchor_index, index + 1))
                 elif index < self.__anchor_index:
-                    for new_index in range(index, self.__anchor_index + 1):
-                        self.__indexes.add(new_index)
+                    self.__indexes.update(range(index, self.__anchor_index + 1))
             else:
                 self.__anchor_index = index
                 self.__indexes.add(index)
-            if old_index != self.__indexes:
+            if len(self.__indexes) != old_count:
                 self.__fire_changed_event()
         elif self.selection_style in (Style.single, Style.single_or_none):
             self.set(index)
@@ -240,34 +237,27 @@ class IndexedSelection:
                 self.set(new_index)
 
     def insert_index(self, new_index: int) -> None:
-        new_indexes = set()
-        for index in self.__indexes:
-            if index < new_index:
-                new_indexes.add(index)
-            else:
-                new_indexes.add(index + 1)
+        # only indexes at or after the insertion point move; skip rebuilding the set when there are none.
+        indexes = self.__indexes
+        changed = bool(indexes) and max(indexes) >= new_index
         if self.__anchor_index is not None:
             if new_index <= self.__anchor_index:
                 self.__anchor_index += 1
-        if self.__indexes != new_indexes:
-            self.__indexes = new_indexes
+        if changed:
+            self.__indexes = {index + 1 if index >= new_index else index for index in indexes}
             if self.expanded_changed_event:
                 self.__fire_changed_event()
 
     def remove_index(self, remove_index: int) -> None:
-        new_indexes = set()
-        for index in self.__indexes:
-            if index != remove_index:
-                if index > remove_index:
-                    new_indexes.add(index - 1)
-                else:
-                    new_indexes.add(index)
+        # only indexes at or after the removal point change; skip rebuilding the set when there are none.
+        indexes = self.__indexes
+        changed = bool(indexes) and max(indexes) >= remove_index
         if self.__anchor_index is not None:
             if remove_index == self.__anchor_index:
                 self.__update_anchor_index()
             elif remove_index < self.__anchor_index:
                 self.__anchor_index -= 1
-        if self.__indexes != new_indexes:
-            self.__indexes = new_indexes
+        if changed:
+            self.__indexes = {index - 1 if index > remove_index else index for index in indexes if index != remove_index}
             if self.expanded_changed_event:
                 self.__fire_changed_event()
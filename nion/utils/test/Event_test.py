@@ -0,0 +1,56 @@
+# standard libraries
+import logging
+import typing
+import unittest
+
+# third party libraries
+# None
+
+# local libraries
+from nion.utils import Event
+
+
+class TestEventClass(unittest.TestCase):
+
+    def setUp(self) -> None:
+        pass
+
+    def tearDown(self) -> None:
+        pass
+
+    def test_fire_calls_listeners_in_order_added(self) -> None:
+        event = Event.Event()
+        calls: typing.List[typing.Tuple[str, int, int]] = list()
+        listener1 = event.listen(lambda a, b=0: calls.append(("1", a, b)))
+        event.fire(1, b=2)
+        self.assertEqual([("1", 1, 2)], calls)
+        listener2 = event.listen(lambda a, b=0: calls.append(("2", a, b)))
+        event.fire(3)
+        self.assertEqual([("1", 1, 2), ("1", 3, 0), ("2", 3, 0)], calls)
+        del listener1
+        event.fire(4)
+        self.assertEqual([("1", 1, 2), ("1", 3, 0), ("2", 3, 0), ("2", 4, 0)], calls)
+        del listener2
+        event.fire(5)
+        self.assertEqual(4, len(calls))
+
+    def test_listener_added_during_fire_is_called_on_next_fire(self) -> None:
+        event = Event.Event()
+        calls: typing.List[str] = list()
+        listeners: typing.List[Event.EventListener] = list()
+
+        def listen() -> None:
+            calls.append("1")
+            if not listeners:
+                listeners.append(event.listen(lambda: calls.append("2")))
+
+        with event.listen(listen):
+            event.fire()
+            self.assertEqual(["1"], calls)
+            event.fire()
+            self.assertEqual(["1", "1", "2"], calls)
+
+
+if __name__ == '__main__':
+    logging.getLogger().setLevel(logging.DEBUG)
+    unittest.main()
@@ -1,5 +1,6 @@
 # standard libraries
 import contextlib
+import gc
 import logging
 import typing
 import unittest
@@ -15,18 +16,31 @@ from nion.utils import Observable
 
 
 class A:
+    __slots__ = ("s",)
+
     def __init__(self, s: str) -> None:
         self.s = s
 
 
 class B:
+    __slots__ = ("s",)
+
     def __init__(self, a: A) -> None:
         self.s = a.s + "_B"
 
 
 class C:
+    __slots__ = ("__item_changed_event",)
+
     def __init__(self) -> None:
-        self.item_changed_event = Event.Event()
+        self.__item_changed_event: typing.Optional[Event.Event] = None
+
+    @property
+    def item_changed_event(self) -> Event.Event:
+        # created on first use so that items which are never observed do not allocate an event.
+        if self.__item_changed_event is None:
+            self.__item_changed_event = Event.Event()
+        return self.__item_changed_event
 
 
 class TestListModelClass(unittest.TestCase):
@@ -96,6 +110,37 @@ class TestListModelClass(unittest.TestCase):
         del model9
         self.assertIsNone(model_ref9())
 
+    def test_list_models_are_freed_without_cycle_collection(self) -> None:
+        # models reference their container strongly and are referenced by it only weakly (through listeners), so
+        # they are freed by reference counting alone.
+        gc.disable()
+        try:
+            l = ListModel.ListModel[typing.Any]("items")
+            l.append_item(C())
+            model = ListModel.FilteredListModel(container=l, items_key="items")
+            model_ref = weakref.ref(model)
+            del model
+            self.assertIsNone(model_ref())
+            model2 = ListModel.MappedListModel(container=l, master_items_key="items", items_key="items")
+            model_ref2 = weakref.ref(model2)
+            del model2
+            self.assertIsNone(model_ref2())
+            l2 = ListModel.ListModel[typing.Any]("items")
+            l2.append_item(ListModel.ListModel[typing.Any]("items"))
+            model3 = ListModel.FlattenedListModel(container=l2, master_items_key="items", child_items_key="items", items_key="items")
+            model_ref3 = weakref.ref(model3)
+            del model3
+            self.assertIsNone(model_ref3())
+            model4 = ListModel.ListPropertyModel(l)
+            model_ref4 = weakref.ref(model4)
+            del model4
+            self.assertIsNone(model_ref4())
+            l_ref = weakref.ref(l)
+            del l
+            self.assertIsNone(l_ref())
+        finally:
+            gc.enable()
+
     def test_filtered_list_is_sorted(self) -> None:
         l = ListModel.ListModel[typing.Any]("items")
         l.append_item("3")
@@ -113,6 +158,30 @@ class TestListModelClass(unittest.TestCase):
         l.insert_item(0, "1")
         self.assertEqual(["1", "2", "3", "5"], l2.items)
 
+    def test_filtered_list_inserts_into_sorted_list_computing_only_new_sort_key(self) -> None:
+        for sort_reverse in (False, True):
+            with self.subTest(sort_reverse=sort_reverse):
+                l = ListModel.ListModel[typing.Any]("items")
+                for item in ("3", "1", "4", "2"):
+                    l.append_item(item)
+                sort_keys = list()
+
+                def sort_key(x: typing.Any) -> typing.Any:
+                    sort_keys.append(x)
+                    return x
+
+                l2 = ListModel.FilteredListModel(container=l, items_key="items")
+                l2.sort_reverse = sort_reverse
+                l2.sort_key = sort_key
+                sort_keys.clear()
+                l.insert_item(0, "0")
+                l.insert_item(0, "5")
+                l.insert_item(0, "25")
+                self.assertEqual(["0", "5", "25"], sort_keys)
+                self.assertEqual(sorted(["0", "1", "2", "25", "3", "4", "5"], reverse=sort_reverse), l2.items)
+                l.remove_item(l.items.index("3"))
+                self.assertEqual(sorted(["0", "1", "2", "25", "4", "5"], reverse=sort_reverse), l2.items)
+
     def test_filtered_list_unsorted_retains_order(self) -> None:
         l = ListModel.ListModel[typing.Any]("items")
         l.append_item("3")
@@ -133,6 +202,30 @@ class TestListModelClass(unittest.TestCase):
         l2.end_change()
         self.assertEqual(["5", "3", "1", "2", "44", "6"], l2.items)
 
+    def test_filtered_list_evaluates_filter_only_for_new_items_on_insert(self) -> None:
+        l = ListModel.ListModel[typing.Any]("items")
+        for item in ("3", "1", "4", "2"):
+            l.append_item(item)
+        matched_items = list()
+
+        def predicate(x: typing.Any) -> bool:
+            matched_items.append(x)
+            return bool(x != "4")
+
+        l2 = ListModel.FilteredListModel(container=l, items_key="items")
+        l2.filter = ListModel.PredicateFilter(predicate)
+        matched_items.clear()
+        l.append_item("5")
+        l.insert_item(3, "44")
+        self.assertEqual(["5", "44"], matched_items)
+        self.assertEqual(["3", "1", "44", "2", "5"], l2.items)
+        l.remove_item(0)
+        l.insert_item(0, "3")
+        self.assertEqual(["5", "44", "3"], matched_items)
+        self.assertEqual(["3", "1", "44", "2", "5"], l2.items)
+        l2.mark_changed()
+        self.assertEqual(["3", "1", "4", "44", "2", "5"], matched_items[3:])
+
     def test_filtered_list_changing_from_sorted_to_unsorted_retains_order(self) -> None:
         l = ListModel.ListModel[typing.Any]("items")
         l.append_item("3")
@@ -180,6 +273,72 @@ class TestListModelClass(unittest.TestCase):
         self.assertEqual(["4", "1", "2", "3"], l3.items)
         self.assertEqual(["4", "1", "2", "3"], l4.items)
 
+    def test_filtered_list_changing_container_builds_items_in_one_change(self) -> None:
+        l = ListModel.ListModel[typing.Any]("items")
+        for item in ("3", "1", "4", "2"):
+            l.append_item(item)
+        l2 = ListModel.ListModel[typing.Any]("items")
+        for item in ("2", "5", "4"):
+            l2.append_item(item)
+        l3 = ListModel.FilteredListModel(container=l, items_key="items")
+        self.assertEqual(["3", "1", "4", "2"], l3.items)
+        l3.sort_key = lambda x: x
+        begin_changes_count = 0
+
+        def begin_changes(key: str) -> None:
+            nonlocal begin_changes_count
+            begin_changes_count += 1
+
+        with l3.begin_changes_event.listen(begin_changes):
+            l3.container = l2
+        self.assertEqual(1, begin_changes_count)
+        self.assertEqual(["2", "4", "5"], l3.items)
+
+    def test_filtered_list_setting_same_container_does_nothing(self) -> None:
+        l = ListModel.ListModel[typing.Any]("items")
+        for item in ("3", "1", "4", "2"):
+            l.append_item(item)
+        l2 = ListModel.FilteredListModel(container=l, items_key="items")
+        reset_list_count = 0
+
+        def reset_list(key: str) -> None:
+            nonlocal reset_list_count
+            reset_list_count += 1
+
+        with l2.reset_list_event.listen(reset_list):
+            l2.container = l
+            self.assertEqual(0, reset_list_count)
+            self.assertEqual(["3", "1", "4", "2"], l2.items)
+            l.append_item("5")
+            self.assertEqual(["3", "1", "4", "2", "5"], l2.items)
+
+    def test_filtered_list_resetting_to_same_order_does_not_replace_items(self) -> None:
+        l = ListModel.ListModel[typing.Any]("items")
+        for item in ("3", "1", "4", "2"):
+            l.append_item(item)
+        l1 = ListModel.FilteredListModel(container=l, items_key="items")
+        l2 = ListModel.FilteredListModel(container=l1, items_key="items")
+        l2.sort_key = lambda x: x
+        changes = list()
+
+        def item_inserted(key: str, item: typing.Any, before_index: int) -> None:
+            changes.append(("insert", item))
+
+        def item_removed(key: str, item: typing.Any, index: int) -> None:
+            changes.append(("remove", item))
+
+        with l2.item_inserted_event.listen(item_inserted), l2.item_removed_event.listen(item_removed):
+            l2.sort_key = lambda x: int(x)
+            self.assertEqual([], changes)
+            # resetting the container marks the items as not sorted; the rebuild finds them in the same order.
+            l1.filter = ListModel.Filter(True)
+            l2.mark_changed()
+            self.assertEqual([], changes)
+            self.assertEqual(["1", "2", "3", "4"], l2.items)
+            l2.sort_reverse = True
+            self.assertEqual(8, len(changes))
+            self.assertEqual(["4", "3", "2", "1"], l2.items)
+
     def test_filtered_list_sends_begin_end_changes_for_single_insert_and_remove(self) -> None:
         l = ListModel.ListModel[typing.Any]("items")
         l.append_item("3")
@@ -237,6 +396,57 @@ class TestListModelClass(unittest.TestCase):
         self.assertEqual(1, begin_changes_count)
         self.assertEqual(1, end_changes_count)
 
+    def test_filtered_list_sends_single_begin_end_changes_for_grouped_inserts(self) -> None:
+        l = ListModel.ListModel[typing.Any]("items")
+        l.append_item("3")
+        l.append_item("1")
+        l2 = ListModel.FilteredListModel(container=l, items_key="items")
+        l2.sort_key = lambda x: x
+
+        begin_changes_count = 0
+        end_changes_count = 0
+
+        def begin_changes(key: str) -> None:
+            nonlocal begin_changes_count
+            begin_changes_count += 1
+
+        def end_changes(key: str) -> None:
+            nonlocal end_changes_count
+            end_changes_count += 1
+
+        with l2.begin_changes_event.listen(begin_changes), l2.end_changes_event.listen(end_changes):
+            with l2.changes():
+                l.insert_item(0, "5")
+                l.insert_item(0, "2")
+                l.remove_item(2)
+
+        self.assertEqual(["1", "2", "5"], l2.items)
+        self.assertEqual(1, begin_changes_count)
+        self.assertEqual(1, end_changes_count)
+
+    def test_filtered_list_sends_begin_end_changes_after_unbalanced_container_changes(self) -> None:
+        l = ListModel.ListModel[typing.Any]("items")
+        l.append_item("a")
+        l2 = ListModel.ListModel[typing.Any]("items")
+        events = list()
+        # attach to a container in the middle of a change; the container sends an end without a begin.
+        m = ListModel.MappedListModel(container=l, master_items_key="items", items_key="items")
+        m.begin_change()
+        f = ListModel.FilteredListModel(container=m, items_key="items")
+        with f.begin_changes_event.listen(lambda key: events.append("b")), f.end_changes_event.listen(lambda key: events.append("e")):
+            m.end_change()
+            events.clear()
+            l.append_item("c")
+            self.assertEqual(["b", "e"], events)
+            # switch away from a container in the middle of a change; its end will not arrive.
+            m.begin_change()
+            f.container = l2
+            m.end_change()
+            events.clear()
+            l2.append_item("d")
+            self.assertEqual(["b", "e"], events)
+            self.assertEqual(["d"], f.items)
+
     def test_filtered_list_does_not_access_container_when_closing(self) -> None:
         class Container(Observable.Observable):
             def __init__(self) -> None:
@@ -276,6 +486,26 @@ class TestListModelClass(unittest.TestCase):
         l.remove_item(0)  # A
         self.assertEqual({0, 1}, s.indexes)
 
+    def test_list_model_items_are_not_changed_by_later_changes(self) -> None:
+        l = ListModel.ListModel[typing.Any]("as")
+        bs = ListModel.ListModel[typing.Any]("bs")
+        bs.append_item("1")
+        bs.append_item("2")
+        l.append_item(bs)
+        filtered = ListModel.FilteredListModel(container=bs, items_key="bs")
+        mapped = ListModel.MappedListModel(container=bs, master_items_key="bs")
+        flattened = ListModel.FlattenedListModel(container=l, master_items_key="as", child_items_key="bs")
+        for list_model in (filtered, mapped, flattened):
+            with self.subTest(list_model=type(list_model).__name__):
+                items = list_model.items
+                self.assertIs(items, list_model.items)
+                bs.insert_item(0, "0")
+                bs.remove_item(2)
+                self.assertEqual(["1", "2"], items)
+                self.assertEqual(["0", "1"], list_model.items)
+                bs.remove_item(0)
+                bs.append_item("2")
+
     def test_initial_mapped_model_values_are_correct(self) -> None:
         l = ListModel.ListModel[typing.Any]("items")
         l.append_item(A("1"))
@@ -11,6 +11,7 @@ import weakref
 
 # local libraries
 from nion.utils import Model
+from nion.utils import Observable
 from nion.utils import Stream
 
 
@@ -49,6 +50,100 @@ class TestModelClass(unittest.TestCase):
             del model3
             self.assertIsNone(model_ref3())
 
+    def test_func_stream_value_model_coalesces_burst_of_value_funcs(self) -> None:
+        with event_loop_context() as event_loop:
+            calls = list()
+
+            def make_value_fn(x: int) -> typing.Callable[[], int]:
+                def value_fn() -> int:
+                    calls.append(x)
+                    return x
+                return value_fn
+
+            value_func_stream = Stream.ValueStream(make_value_fn(0))
+            model = Model.FuncStreamValueModel(value_func_stream, event_loop)
+            for i in range(1, 10):
+                value_func_stream.value = make_value_fn(i)
+            model._run_until_complete()
+            self.assertEqual(9, model.value)
+            self.assertEqual([9], calls)
+            del model
+
+    def test_func_stream_value_model_evaluates_inline(self) -> None:
+        with event_loop_context() as event_loop:
+            value_func_stream = Stream.ValueStream(lambda: 1)
+            model = Model.FuncStreamValueModel(value_func_stream, event_loop, inline=True)
+            model._run_until_complete()
+            self.assertEqual(1, model.value)
+            value_func_stream.value = lambda: 2
+            model._run_until_complete()
+            self.assertEqual(2, model.value)
+            del model
+
+    def test_func_stream_value_model_run_until_complete_runs_loop_when_idle(self) -> None:
+        with event_loop_context() as event_loop:
+            model = Model.FuncStreamValueModel(Stream.ValueStream(lambda: 1), event_loop, inline=True)
+            model._run_until_complete()
+            callbacks: typing.List[int] = list()
+            event_loop.call_soon(callbacks.append, 1)
+            model._run_until_complete()
+            self.assertEqual([1], callbacks)
+            del model
+
+    def test_property_changed_property_model_tracks_observed_property(self) -> None:
+
+        class ClampedObservable(Observable.Observable):
+            def __init__(self) -> None:
+                super().__init__()
+                self.__x = 0
+                self.changed_count = 0
+
+            @property
+            def x(self) -> int:
+                return self.__x
+
+            @x.setter
+            def x(self, value: int) -> None:
+                value = min(value, 10)
+                if value != self.__x:
+                    self.__x = value
+                    self.changed_count += 1
+                    self.notify_property_changed("x")
+
+        observable = ClampedObservable()
+        model = Model.PropertyChangedPropertyModel[int](observable, "x")
+        model.value = 5
+        self.assertEqual(5, observable.x)
+        self.assertEqual(1, observable.changed_count)
+        observable.x = 7
+        self.assertEqual(7, model.value)
+        model.value = 8
+        self.assertEqual(8, observable.x)
+        self.assertEqual(3, observable.changed_count)
+        model.value = 20
+        self.assertEqual(10, observable.x)
+        self.assertEqual(10, model.value)
+
+    def test_property_model_notifies_listeners_and_overridden_notify(self) -> None:
+        changes = list()
+
+        class NotifyingPropertyModel(Model.PropertyModel[int]):
+            def notify_property_changed(self, key: str) -> None:
+                super().notify_property_changed(key)
+                changes.append(key)
+
+        model = Model.PropertyModel[int](0)
+        model.value = 1
+        listener = model.property_changed_event.listen(changes.append)
+        model.value = 2
+        self.assertEqual(["value"], changes)
+        del listener
+        model.value = 3
+        self.assertEqual(["value"], changes)
+        model2 = NotifyingPropertyModel(0)
+        model2.value = 1
+        self.assertEqual(["value", "value"], changes)
+
 
 if __name__ == '__main__':
     logging.getLogger().setLevel(logging.DEBUG)
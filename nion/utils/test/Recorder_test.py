@@ -9,10 +9,56 @@ import weakref
 # None
 
 # local libraries
+from nion.utils import Observable
 from nion.utils import StructuredModel
 from nion.utils import Recorder
 
 
+class PropertiesObservable(Observable.Observable):
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.item_names: typing.List[str] = list()
+        self.relationship_names: typing.List[str] = list()
+        self.a = 0
+        self.b = 0
+
+    def set(self, key: str, value: int) -> None:
+        setattr(self, key, value)
+        self.notify_property_changed(key)
+
+
+class PredicatePropertiesObservable(PropertiesObservable):
+
+    def _is_persistent_property_recordable(self, key: str) -> bool:
+        return key == "a"
+
+
+class StaticPredicatePropertiesObservable(PropertiesObservable):
+
+    @staticmethod
+    def _is_persistent_property_recordable(key: str) -> bool:
+        return key == "a"
+
+
+class InstancePredicatePropertiesObservable(PropertiesObservable):
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._is_persistent_property_recordable = lambda key: key == "a"
+
+
+class KeysPropertiesObservable(PropertiesObservable):
+
+    _persistent_property_keys = frozenset(["b"])
+
+
+class ModelAccessor(Recorder.Accessor):
+
+    def get(self, o: typing.Any) -> typing.Any:
+        return o.model
+
+
 class TestRecorderClass(unittest.TestCase):
 
     def setUp(self) -> None:
@@ -66,6 +112,137 @@ class TestRecorderClass(unittest.TestCase):
         del r
         self.assertIsNone(r_ref())
 
+    @typing.no_type_check
+    def test_changes_to_inserted_item_after_insert_are_applied_once(self) -> None:
+        # create the model
+        y_field = StructuredModel.define_field("y", StructuredModel.INT)
+        inner_record = StructuredModel.define_record("S", [y_field])
+        x_field = StructuredModel.define_field("x", StructuredModel.INT)
+        b_field = StructuredModel.define_field("b", StructuredModel.define_array(inner_record))
+        record = StructuredModel.define_record("R", [x_field, b_field])
+        schema = StructuredModel.define_record("A", [StructuredModel.define_field("a", StructuredModel.define_array(record))])
+        model = StructuredModel.build_model(schema, value={"a": [{"x": 1, "b": []}]})
+        model_copy = copy.deepcopy(model)
+        # create recorder
+        r = Recorder.Recorder(model)
+        # insert an item and then change it
+        model.a.insert(1, StructuredModel.build_model(record, value={"x": 2, "b": []}))
+        model.a[1].x = 3
+        model.a[1].b.insert(0, StructuredModel.build_model(inner_record, value={"y": 4}))
+        r.apply(model_copy)
+        self.assertEqual(model.to_dict_value(), model_copy.to_dict_value())
+
+    @typing.no_type_check
+    def test_insert_into_inserted_item_is_applied_once(self) -> None:
+        # create the model
+        y_field = StructuredModel.define_field("y", StructuredModel.INT)
+        inner_record = StructuredModel.define_record("S", [y_field])
+        b_field = StructuredModel.define_field("b", StructuredModel.define_array(inner_record))
+        record = StructuredModel.define_record("R", [b_field])
+        schema = StructuredModel.define_record("A", [StructuredModel.define_field("a", StructuredModel.define_array(record))])
+        model = StructuredModel.build_model(schema, value={"a": []})
+        model_copy = copy.deepcopy(model)
+        # create recorder
+        r = Recorder.Recorder(model)
+        # insert an item and then insert into it
+        model.a.insert(0, StructuredModel.build_model(record, value={"b": []}))
+        model.a[0].b.insert(0, StructuredModel.build_model(inner_record, value={"y": 4}))
+        r.apply(model_copy)
+        self.assertEqual([{"y": 4}], model_copy.to_dict_value()["a"][0]["b"])
+        self.assertEqual(model.to_dict_value(), model_copy.to_dict_value())
+
+    @typing.no_type_check
+    def test_remove_from_inserted_item_is_applied_once(self) -> None:
+        # create the model
+        y_field = StructuredModel.define_field("y", StructuredModel.INT)
+        inner_record = StructuredModel.define_record("S", [y_field])
+        b_field = StructuredModel.define_field("b", StructuredModel.define_array(inner_record))
+        record = StructuredModel.define_record("R", [b_field])
+        schema = StructuredModel.define_record("A", [StructuredModel.define_field("a", StructuredModel.define_array(record))])
+        model = StructuredModel.build_model(schema, value={"a": []})
+        model_copy = copy.deepcopy(model)
+        # create recorder
+        r = Recorder.Recorder(model)
+        # insert an item and then remove from it
+        model.a.insert(0, StructuredModel.build_model(record, value={"b": [{"y": 1}, {"y": 2}]}))
+        del model.a[0].b[0]
+        r.apply(model_copy)
+        self.assertEqual([{"y": 2}], model_copy.to_dict_value()["a"][0]["b"])
+        self.assertEqual(model.to_dict_value(), model_copy.to_dict_value())
+
+    @typing.no_type_check
+    def test_changes_to_nested_item_after_index_shift_are_applied_to_shifted_item(self) -> None:
+        # create the model
+        y_field = StructuredModel.define_field("y", StructuredModel.INT)
+        inner_record = StructuredModel.define_record("S", [y_field])
+        b_field = StructuredModel.define_field("b", StructuredModel.define_array(inner_record))
+        record = StructuredModel.define_record("R", [b_field])
+        schema = StructuredModel.define_record("A", [StructuredModel.define_field("a", StructuredModel.define_array(record))])
+        model = StructuredModel.build_model(schema, value={"a": [{"b": [{"y": 1}]}, {"b": [{"y": 2}]}]})
+        model_copy = copy.deepcopy(model)
+        # create recorder
+        r = Recorder.Recorder(model)
+        # change before and after shifting the items
+        model.a[1].b[0].y = 3
+        model.a.insert(0, StructuredModel.build_model(record, value={"b": [{"y": 0}]}))
+        model.a[2].b[0].y = 4
+        del model.a[0]
+        model.a[0].b[0].y = 5
+        r.apply(model_copy)
+        self.assertEqual(model.to_dict_value(), model_copy.to_dict_value())
+
+    @typing.no_type_check
+    def test_apply_runs_of_property_changes_around_inserts(self) -> None:
+        # create the model
+        x_field = StructuredModel.define_field("x", StructuredModel.INT)
+        y_field = StructuredModel.define_field("y", StructuredModel.INT)
+        record = StructuredModel.define_record("R", [x_field, y_field])
+        schema = StructuredModel.define_record("A", [StructuredModel.define_field("a", StructuredModel.define_array(record))])
+        model = StructuredModel.build_model(schema, value={"a": [{"x": 1, "y": 2}, {"x": 3, "y": 4}]})
+        model_copy = copy.deepcopy(model)
+        # create recorder
+        r = Recorder.Recorder(model)
+        # change the same item repeatedly, shifting it in between
+        for i in range(5):
+            model.a[1].x = i
+            model.a[1].y = -i
+        model.a.insert(0, StructuredModel.build_model(record, value={"x": 5, "y": 6}))
+        for i in range(5):
+            model.a[1].x = 10 + i
+            model.a[2].y = 20 + i
+        r.apply(model_copy)
+        self.assertEqual(model.to_dict_value(), model_copy.to_dict_value())
+
+    @typing.no_type_check
+    def test_recorder_with_custom_accessor_applies_to_accessed_object(self) -> None:
+        # create the model
+        x_field = StructuredModel.define_field("x", StructuredModel.INT)
+        record = StructuredModel.define_record("R", [x_field])
+        schema = StructuredModel.define_record("A", [StructuredModel.define_field("a", StructuredModel.define_array(record))])
+        model = StructuredModel.build_model(schema, value={"a": [{"x": 1}]})
+        container_copy = PropertiesObservable()
+        container_copy.model = copy.deepcopy(model)
+        # create recorder
+        r = Recorder.Recorder(model, ModelAccessor())
+        model.a[0].x = 2
+        model.a.insert(0, StructuredModel.build_model(record, value={"x": 3}))
+        model.a[1].x = 4
+        r.apply(container_copy)
+        self.assertEqual(model.to_dict_value(), container_copy.model.to_dict_value())
+
+    def test_property_changes_are_filtered_by_recordable_predicate_or_keys(self) -> None:
+        for observable_class, expected in ((PropertiesObservable, (1, 2)), (PredicatePropertiesObservable, (1, 0)),
+                                           (StaticPredicatePropertiesObservable, (1, 0)),
+                                           (InstancePredicatePropertiesObservable, (1, 0)), (KeysPropertiesObservable, (0, 2))):
+            with self.subTest(observable_class=observable_class.__name__):
+                observable = observable_class()
+                r = Recorder.Recorder(observable)
+                observable.set("a", 1)
+                observable.set("b", 2)
+                observable_copy = observable_class()
+                r.apply(observable_copy)
+                self.assertEqual(expected, (observable_copy.a, observable_copy.b))
+
 
 if __name__ == '__main__':
     logging.getLogger().setLevel(logging.DEBUG)
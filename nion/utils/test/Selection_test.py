@@ -31,6 +31,52 @@ class TestSelection(unittest.TestCase):
         s.insert_index(1)
         self.assertEqual({0, 3, 5}, s.indexes)
 
+    def test_removing_index_from_selection_adjusts_indexes_and_fires_only_when_changed(self) -> None:
+        s = Selection.IndexedSelection(expanded_changed_event=True)
+        s.set_multiple({0, 2, 4})
+        changed_count = 0
+
+        def selection_changed() -> None:
+            nonlocal changed_count
+            changed_count += 1
+
+        with s.changed_event.listen(selection_changed):
+            s.remove_index(5)
+            s.insert_index(5)
+            self.assertEqual({0, 2, 4}, s.indexes)
+            self.assertEqual(0, changed_count)
+            s.remove_index(2)
+            self.assertEqual({0, 3}, s.indexes)
+            s.remove_index(1)
+            self.assertEqual({0, 2}, s.indexes)
+            self.assertEqual(2, changed_count)
+
+    def test_changing_selection_fires_only_when_changed(self) -> None:
+        s = Selection.IndexedSelection()
+        changed_count = 0
+
+        def selection_changed() -> None:
+            nonlocal changed_count
+            changed_count += 1
+
+        with s.changed_event.listen(selection_changed):
+            s.add(2)
+            s.add(2)
+            self.assertEqual(1, changed_count)
+            s.extend(4)
+            s.extend(3)
+            self.assertEqual({2, 3, 4}, s.indexes)
+            self.assertEqual(2, changed_count)
+            s.set_multiple({2, 3, 4})
+            self.assertEqual(2, changed_count)
+            s.set(3)
+            s.set(3)
+            self.assertEqual(3, changed_count)
+            s.clear()
+            s.clear()
+            self.assertEqual(set(), s.indexes)
+            self.assertEqual(4, changed_count)
+
 
 if __name__ == '__main__':
     logging.getLogger().setLevel(logging.DEBUG)